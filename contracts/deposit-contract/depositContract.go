@@ -27,10 +27,10 @@ var (
 )
 
 // DepositContractABI is the input ABI used to generate the binding from.
-const DepositContractABI = "[{\"name\":\"DepositEvent\",\"inputs\":[{\"type\":\"bytes\",\"name\":\"pubkey\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"withdrawal_credentials\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"amount\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"signature\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"index\",\"indexed\":false}],\"anonymous\":false,\"type\":\"event\"},{\"outputs\":[],\"inputs\":[{\"type\":\"address\",\"name\":\"_drain_address\"}],\"constant\":false,\"payable\":false,\"type\":\"constructor\"},{\"name\":\"get_deposit_root\",\"outputs\":[{\"type\":\"bytes32\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":95389},{\"name\":\"get_deposit_count\",\"outputs\":[{\"type\":\"bytes\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":17683},{\"name\":\"deposit\",\"outputs\":[],\"inputs\":[{\"type\":\"bytes\",\"name\":\"pubkey\"},{\"type\":\"bytes\",\"name\":\"withdrawal_credentials\"},{\"type\":\"bytes\",\"name\":\"signature\"},{\"type\":\"bytes32\",\"name\":\"deposit_data_root\"}],\"constant\":false,\"payable\":true,\"type\":\"function\",\"gas\":1754607},{\"name\":\"drain\",\"outputs\":[],\"inputs\":[],\"constant\":false,\"payable\":false,\"type\":\"function\",\"gas\":35793},{\"name\":\"drain_address\",\"outputs\":[{\"type\":\"address\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":663}]"
+const DepositContractABI = "[{\"name\":\"DepositEvent\",\"inputs\":[{\"type\":\"bytes\",\"name\":\"pubkey\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"withdrawal_credentials\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"amount\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"signature\",\"indexed\":false},{\"type\":\"bytes\",\"name\":\"index\",\"indexed\":false}],\"anonymous\":false,\"type\":\"event\"},{\"outputs\":[],\"inputs\":[{\"type\":\"address\",\"name\":\"_drain_address\"}],\"constant\":false,\"payable\":false,\"type\":\"constructor\"},{\"name\":\"deposit\",\"outputs\":[],\"inputs\":[{\"type\":\"bytes\",\"name\":\"pubkey\"},{\"type\":\"bytes\",\"name\":\"withdrawal_credentials\"},{\"type\":\"bytes\",\"name\":\"signature\"},{\"type\":\"bytes32\",\"name\":\"deposit_data_root\"}],\"constant\":false,\"payable\":true,\"type\":\"function\",\"gas\":1744110},{\"name\":\"get_deposit_root\",\"outputs\":[{\"type\":\"bytes32\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":91791},{\"name\":\"get_deposit_count\",\"outputs\":[{\"type\":\"bytes\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":15174},{\"name\":\"drain\",\"outputs\":[],\"inputs\":[],\"constant\":false,\"payable\":false,\"type\":\"function\",\"gas\":35793},{\"name\":\"drain_address\",\"outputs\":[{\"type\":\"address\",\"name\":\"out\"}],\"inputs\":[],\"constant\":true,\"payable\":false,\"type\":\"function\",\"gas\":663}]"
 
 // DepositContractBin is the compiled bytecode used for deploying new contracts.
-var DepositContractBin = "0x740100000000000000000000000000000000000000006020526f7fffffffffffffffffffffffffffffff6040527fffffffffffffffffffffffffffffffff8000000000000000000000000000000060605274012a05f1fffffffffffffffffffffffffdabf41c006080527ffffffffffffffffffffffffed5fa0e000000000000000000000000000000000060a05260206112736101403934156100a157600080fd5b602061127360c03960c05160205181106100ba57600080fd5b50610140516002556101606000601f818352015b600061016051602081106100e157600080fd5b600360c052602060c0200154602082610180010152602081019050610160516020811061010d57600080fd5b600360c052602060c020015460208261018001015260208101905080610180526101809050602060c0825160208401600060025af161014b57600080fd5b60c0519050606051600161016051018060405190131561016a57600080fd5b809190121561017857600080fd5b6020811061018557600080fd5b600360c052602060c02001555b81516001018083528114156100ce575b505061125b56600035601c52740100000000000000000000000000000000000000006020526f7fffffffffffffffffffffffffffffff6040527fffffffffffffffffffffffffffffffff8000000000000000000000000000000060605274012a05f1fffffffffffffffffffffffffdabf41c006080527ffffffffffffffffffffffffed5fa0e000000000000000000000000000000000060a052600015610265575b6101605261014052600061018052610140516101a0526101c060006008818352015b61018051600860008112156100da578060000360020a82046100e1565b8060020a82025b905090506101805260ff6101a051166101e052610180516101e0516101805101101561010c57600080fd5b6101e0516101805101610180526101a0517ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff86000811215610155578060000360020a820461015c565b8060020a82025b905090506101a0525b81516001018083528114156100bd575b50506018600860208206610200016020828401111561019357600080fd5b60208061022082610180600060046015f15050818152809050905090508051602001806102c0828460006004600a8704601201f16101d057600080fd5b50506103206102c0516020818352015b60206103205111156101f15761020d565b6000610320516102e001535b81516001018083528114156101e0575b505060206102a05260406102c0510160206001820306601f8201039050610280525b6000610280511115156102415761025d565b602061028051036102a00151602061028051036102805261022f565b610160515650005b63c5f2892f60005114156104f757341561027e57600080fd5b6000610140526101405161016052600154610180526101a060006020818352015b60016001610180511614156103205760006101a051602081106102c157600080fd5b600060c052602060c02001546020826102400101526020810190506101605160208261024001015260208101905080610240526102409050602060c0825160208401600060025af161031257600080fd5b60c05190506101605261038e565b6000610160516020826101c00101526020810190506101a0516020811061034657600080fd5b600360c052602060c02001546020826101c0010152602081019050806101c0526101c09050602060c0825160208401600060025af161038457600080fd5b60c0519050610160525b610180600261039c57600080fd5b60028151048152505b815160010180835281141561029f575b505060006101605160208261046001015260208101905061014051610160516101805163806732896102e05260015461030052610300516006580161009b565b506103605260006103c0525b6103605160206001820306601f82010390506103c0511015156104235761043c565b6103c05161038001526103c0516020016103c052610401565b61018052610160526101405261036060088060208461046001018260208501600060046012f150508051820191505060006018602082066103e0016020828401111561048757600080fd5b60208061040082610140600060046015f150508181528090509050905060188060208461046001018260208501600060046014f150508051820191505080610460526104609050602060c0825160208401600060025af16104e757600080fd5b60c051905060005260206000f350005b63621fd13060005114156105f857341561051057600080fd5b63806732896101405260015461016052610160516006580161009b565b506101c0526000610220525b6101c05160206001820306601f82010390506102205110151561055b57610574565b610220516101e001526102205160200161022052610539565b6101c0805160200180610280828460006004600a8704601201f161059757600080fd5b50506102e0610280516020818352015b60206102e05111156105b8576105d4565b60006102e0516102a001535b81516001018083528114156105a7575b50506020610260526040610280510160206001820306601f8201039050610260f350005b6322895118600051141561105157605060043560040161014037603060043560040135111561062657600080fd5b60406024356004016101c037602060243560040135111561064657600080fd5b608060443560040161022037606060443560040135111561066657600080fd5b63ffffffff6001541061067857600080fd5b633b9aca006102e0526102e05161068e57600080fd5b6102e05134046102c052633b9aca006102c05110156106ac57600080fd5b603061014051146106bc57600080fd5b60206101c051146106cc57600080fd5b606061022051146106dc57600080fd5b610140610360525b61036051516020610360510161036052610360610360511015610706576106e4565b6380673289610380526102c0516103a0526103a0516006580161009b565b50610400526000610460525b6104005160206001820306601f8201039050610460511015156107525761076b565b6104605161042001526104605160200161046052610730565b610340610360525b610360515260206103605103610360526101406103605110151561079657610773565b610400805160200180610300828460006004600a8704601201f16107b957600080fd5b5050610140610480525b610480515160206104805101610480526104806104805110156107e5576107c3565b63806732896104a0526001546104c0526104c0516006580161009b565b50610520526000610580525b6105205160206001820306601f82010390506105805110151561083057610849565b610580516105400152610580516020016105805261080e565b610460610480525b610480515260206104805103610480526101406104805110151561087457610851565b6105208051602001806105a0828460006004600a8704601201f161089757600080fd5b505060a06106205261062051610660526101408051602001806106205161066001828460006004600a8704601201f16108cf57600080fd5b5050610600610620516106600151610240818352015b6102406106005111156108f757610918565b600061060051610620516106800101535b81516001018083528114156108e5575b5050602061062051610660015160206001820306601f82010390506106205101016106205261062051610680526101c08051602001806106205161066001828460006004600a8704601201f161096d57600080fd5b5050610600610620516106600151610240818352015b610240610600511115610995576109b6565b600061060051610620516106800101535b8151600101808352811415610983575b5050602061062051610660015160206001820306601f820103905061062051010161062052610620516106a0526103008051602001806106205161066001828460006004600a8704601201f1610a0b57600080fd5b5050610600610620516106600151610240818352015b610240610600511115610a3357610a54565b600061060051610620516106800101535b8151600101808352811415610a21575b5050602061062051610660015160206001820306601f820103905061062051010161062052610620516106c0526102208051602001806106205161066001828460006004600a8704601201f1610aa957600080fd5b5050610600610620516106600151610240818352015b610240610600511115610ad157610af2565b600061060051610620516106800101535b8151600101808352811415610abf575b5050602061062051610660015160206001820306601f820103905061062051010161062052610620516106e0526105a08051602001806106205161066001828460006004600a8704601201f1610b4757600080fd5b5050610600610620516106600151610240818352015b610240610600511115610b6f57610b90565b600061060051610620516106800101535b8151600101808352811415610b5d575b5050602061062051610660015160206001820306601f8201039050610620510101610620527f649bbc62d0e31342afea4e5cd82d4049e7e1ee912fc0889aa790803be39038c561062051610660a160006107005260006101406030806020846107c001018260208501600060046016f150508051820191505060006010602082066107400160208284011115610c2557600080fd5b60208061076082610700600060046015f15050818152809050905090506010806020846107c001018260208501600060046013f1505080518201915050806107c0526107c09050602060c0825160208401600060025af1610c8557600080fd5b60c0519050610720526000600060406020820661086001610220518284011115610cae57600080fd5b606080610880826020602088068803016102200160006004601bf1505081815280905090509050602060c0825160208401600060025af1610cee57600080fd5b60c0519050602082610a600101526020810190506000604060206020820661092001610220518284011115610d2257600080fd5b606080610940826020602088068803016102200160006004601bf15050818152809050905090506020806020846109e001018260208501600060046015f1505080518201915050610700516020826109e0010152602081019050806109e0526109e09050602060c0825160208401600060025af1610d9f57600080fd5b60c0519050602082610a6001015260208101905080610a6052610a609050602060c0825160208401600060025af1610dd657600080fd5b60c0519050610840526000600061072051602082610b000101526020810190506101c0602080602084610b0001018260208501600060046015f150508051820191505080610b0052610b009050602060c0825160208401600060025af1610e3c57600080fd5b60c0519050602082610c800101526020810190506000610300600880602084610c0001018260208501600060046012f15050805182019150506000601860208206610b800160208284011115610e9157600080fd5b602080610ba082610700600060046015f1505081815280905090509050601880602084610c0001018260208501600060046014f150508051820191505061084051602082610c0001015260208101905080610c0052610c009050602060c0825160208401600060025af1610f0457600080fd5b60c0519050602082610c8001015260208101905080610c8052610c809050602060c0825160208401600060025af1610f3b57600080fd5b60c0519050610ae052606435610ae05114610f5557600080fd5b6001805460018254011015610f6957600080fd5b6001815401815550600154610d0052610d2060006020818352015b60016001610d0051161415610fb957610ae051610d205160208110610fa857600080fd5b600060c052602060c020015561104d565b6000610d205160208110610fcc57600080fd5b600060c052602060c0200154602082610d40010152602081019050610ae051602082610d4001015260208101905080610d4052610d409050602060c0825160208401600060025af161101d57600080fd5b60c0519050610ae052610d00600261103457600080fd5b60028151048152505b8151600101808352811415610f84575b5050005b639890220b600051141561108557341561106a57600080fd5b600060006000600030316002546000f161108357600080fd5b005b638ba35cdf60005114156110ac57341561109e57600080fd5b60025460005260206000f350005b60006000fd5b6101a961125b036101a96000396101a961125b036000f3"
+var DepositContractBin = "0x740100000000000000000000000000000000000000006020526f7fffffffffffffffffffffffffffffff6040527fffffffffffffffffffffffffffffffff8000000000000000000000000000000060605274012a05f1fffffffffffffffffffffffffdabf41c006080527ffffffffffffffffffffffffed5fa0e000000000000000000000000000000000060a05260206112596101403934156100a157600080fd5b602061125960c03960c05160205181106100ba57600080fd5b50610140516002556101606000601f818352015b600061016051602081106100e157600080fd5b600360c052602060c0200154602082610180010152602081019050610160516020811061010d57600080fd5b600360c052602060c020015460208261018001015260208101905080610180526101809050602060c0825160208401600060025af161014b57600080fd5b60c0519050606051600161016051018060405190131561016a57600080fd5b809190121561017857600080fd5b6020811061018557600080fd5b600360c052602060c02001555b81516001018083528114156100ce575b505061124156600035601c52740100000000000000000000000000000000000000006020526f7fffffffffffffffffffffffffffffff6040527fffffffffffffffffffffffffffffffff8000000000000000000000000000000060605274012a05f1fffffffffffffffffffffffffdabf41c006080527ffffffffffffffffffffffffed5fa0e000000000000000000000000000000000060a0526000156102cc575b610160526101405266ff00ff00ff00ff6101006100b757600080fd5b61010061014051041666ff00ff00ff00ff61014051166101a0526101a05115156100e2576000610105565b6101006101a0516101006101a0510204146100fc57600080fd5b6101006101a051025b176101805265ffff0000ffff6201000061011e57600080fd5b6201000061018051041665ffff0000ffff61018051166101c0526101c051151561014957600061016f565b620100006101c051620100006101c05102041461016557600080fd5b620100006101c051025b176101805264010000000061018357600080fd5b640100000000610180510463ffffffff61018051166101e0526101e05115156101ad5760006101d9565b6401000000006101e0516401000000006101e0510204146101cd57600080fd5b6401000000006101e051025b1761018052601860086020820661020001602082840111156101fa57600080fd5b60208061022082610180600060046015f15050818152809050905090508051602001806102c0828460006004600a8704601201f161023757600080fd5b50506103206102c0516020818352015b602061032051111561025857610274565b6000610320516102e001535b8151600101808352811415610247575b505060206102a05260406102c0510160206001820306601f8201039050610280525b6000610280511115156102a8576102c4565b602061028051036102a001516020610280510361028052610296565b610160515650005b63228951186000511415610cbd5760506004356004016101403760306004356004013511156102fa57600080fd5b60406024356004016101c037602060243560040135111561031a57600080fd5b608060443560040161022037606060443560040135111561033a57600080fd5b6001546102c05263ffffffff6102c0511061035457600080fd5b633b9aca00610300526103005161036a57600080fd5b6103005134046102e052633b9aca006102e051101561038857600080fd5b6030610140511461039857600080fd5b60206101c051146103a857600080fd5b606061022051146103b857600080fd5b610140610380525b610380515160206103805101610380526103806103805110156103e2576103c0565b63806732896103a0526102e0516103c0526103c0516006580161009b565b50610420526000610480525b6104205160206001820306601f82010390506104805110151561042e57610447565b610480516104400152610480516020016104805261040c565b610360610380525b61038051526020610380510361038052610140610380511015156104725761044f565b610420805160200180610320828460006004600a8704601201f161049557600080fd5b50506101406104a0525b6104a0515160206104a051016104a0526104a06104a05110156104c15761049f565b63806732896104c0526102c0516104e0526104e0516006580161009b565b506105405260006105a0525b6105405160206001820306601f82010390506105a05110151561050d57610526565b6105a05161056001526105a0516020016105a0526104eb565b6104806104a0525b6104a0515260206104a051036104a0526101406104a0511015156105515761052e565b6105408051602001806105c0828460006004600a8704601201f161057457600080fd5b505060a06106405261064051610680526101408051602001806106405161068001828460006004600a8704601201f16105ac57600080fd5b5050610620610640516106800151610240818352015b6102406106205111156105d4576105f5565b600061062051610640516106a00101535b81516001018083528114156105c2575b5050602061064051610680015160206001820306601f820103905061064051010161064052610640516106a0526101c08051602001806106405161068001828460006004600a8704601201f161064a57600080fd5b5050610620610640516106800151610240818352015b61024061062051111561067257610693565b600061062051610640516106a00101535b8151600101808352811415610660575b5050602061064051610680015160206001820306601f820103905061064051010161064052610640516106c0526103208051602001806106405161068001828460006004600a8704601201f16106e857600080fd5b5050610620610640516106800151610240818352015b61024061062051111561071057610731565b600061062051610640516106a00101535b81516001018083528114156106fe575b5050602061064051610680015160206001820306601f820103905061064051010161064052610640516106e0526102208051602001806106405161068001828460006004600a8704601201f161078657600080fd5b5050610620610640516106800151610240818352015b6102406106205111156107ae576107cf565b600061062051610640516106a00101535b815160010180835281141561079c575b5050602061064051610680015160206001820306601f82010390506106405101016106405261064051610700526105c08051602001806106405161068001828460006004600a8704601201f161082457600080fd5b5050610620610640516106800151610240818352015b61024061062051111561084c5761086d565b600061062051610640516106a00101535b815160010180835281141561083a575b5050602061064051610680015160206001820306601f8201039050610640510101610640527f649bbc62d0e31342afea4e5cd82d4049e7e1ee912fc0889aa790803be39038c561064051610680a160006107205260006101406030806020846107c001018260208501600060046016f15050805182019150506010610760526000610780526107606010806020846107c001018260208501600060046013f1505080518201915050806107c0526107c09050602060c0825160208401600060025af161093857600080fd5b60c051905061074052600060006040602082066108600161022051828401111561096157600080fd5b606080610880826020602088068803016102200160006004601bf1505081815280905090509050602060c0825160208401600060025af16109a157600080fd5b60c05190506020826109a001015260208101905060006102206020604060208351038113156109cf57600080fd5b0460200260200181015190506020826109200101526020810190506107205160208261092001015260208101905080610920526109209050602060c0825160208401600060025af1610a2057600080fd5b60c05190506020826109a0010152602081019050806109a0526109a09050602060c0825160208401600060025af1610a5757600080fd5b60c0519050610840526000600061074051602082610a400101526020810190506101c0602060006020835103811315610a8f57600080fd5b046020026020018101519050602082610a4001015260208101905080610a4052610a409050602060c0825160208401600060025af1610acd57600080fd5b60c0519050602082610ba00101526020810190506000610320600880602084610b2001018260208501600060046012f15050805182019150506018610ac0526000610ae052610ac0601880602084610b2001018260208501600060046014f150508051820191505061084051602082610b2001015260208101905080610b2052610b209050602060c0825160208401600060025af1610b6b57600080fd5b60c0519050602082610ba001015260208101905080610ba052610ba09050602060c0825160208401600060025af1610ba257600080fd5b60c0519050610a2052606435610a205114610bbc57600080fd5b6102c05160016102c051011015610bd257600080fd5b60016102c05101610c2052610c2051600155610c4060006020818352015b60016001610c2051161415610c2557610a2051610c405160208110610c1457600080fd5b600060c052602060c0200155610cb9565b6000610c405160208110610c3857600080fd5b600060c052602060c0200154602082610c60010152602081019050610a2051602082610c6001015260208101905080610c6052610c609050602060c0825160208401600060025af1610c8957600080fd5b60c0519050610a2052610c206002610ca057600080fd5b60028151048152505b8151600101808352811415610bf0575b5050005b63c5f2892f6000511415610f36573415610cd657600080fd5b600061014052610140516101605260015461018052610180516101a0526101c060006020818352015b600160016101a051161415610d805760006101c05160208110610d2157600080fd5b600060c052602060c02001546020826102600101526020810190506101605160208261026001015260208101905080610260526102609050602060c0825160208401600060025af1610d7257600080fd5b60c051905061016052610dee565b6000610160516020826101e00101526020810190506101c05160208110610da657600080fd5b600360c052602060c02001546020826101e0010152602081019050806101e0526101e09050602060c0825160208401600060025af1610de457600080fd5b60c0519050610160525b6101a06002610dfc57600080fd5b60028151048152505b8151600101808352811415610cff575b50506000610160516020826104600101526020810190506101405161016051610180516101a0516380673289610300526101805161032052610320516006580161009b565b506103805260006103e0525b6103805160206001820306601f82010390506103e051101515610e8857610ea1565b6103e0516103a001526103e0516020016103e052610e66565b6101a05261018052610160526101405261038060088060208461046001018260208501600060046012f150508051820191505060186104005260006104205261040060188060208461046001018260208501600060046014f150508051820191505080610460526104609050602060c0825160208401600060025af1610f2657600080fd5b60c051905060005260206000f350005b63621fd1306000511415611037573415610f4f57600080fd5b63806732896101405260015461016052610160516006580161009b565b506101c0526000610220525b6101c05160206001820306601f820103905061022051101515610f9a57610fb3565b610220516101e001526102205160200161022052610f78565b6101c0805160200180610280828460006004600a8704601201f1610fd657600080fd5b50506102e0610280516020818352015b60206102e0511115610ff757611013565b60006102e0516102a001535b8151600101808352811415610fe6575b50506020610260526040610280510160206001820306601f8201039050610260f350005b639890220b600051141561106b57341561105057600080fd5b600060006000600030316002546000f161106957600080fd5b005b638ba35cdf600051141561109257341561108457600080fd5b60025460005260206000f350005b60006000fd5b6101a9611241036101a96000396101a9611241036000f3"
 
 // DeployDepositContract deploys a new Ethereum contract, binding an instance of DepositContract to it.
 func DeployDepositContract(auth *bind.TransactOpts, backend bind.ContractBackend, _drain_address common.Address) (common.Address, *types.Transaction, *DepositContract, error) {
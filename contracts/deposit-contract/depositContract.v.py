@@ -33,44 +33,28 @@ def to_little_endian_64(value: uint256) -> bytes[8]:
     # Reversing bytes using bitwise uint256 manipulations
     # Note: array accesses of bytes[] are not currently supported in Vyper
     # Note: this function is only called when `value < 2**64`
-    y: uint256 = 0
-    x: uint256 = value
-    for _ in range(8):
-        y = shift(y, 8)
-        y = y + bitwise_and(x, 255)
-        x = shift(x, -8)
+    # Note: straight-line SWAR byte swap, cheaper than an 8-step shift loop
+    # Swap adjacent bytes (mask 0x00ff00ff00ff00ff)
+    y: uint256 = bitwise_or(bitwise_and(value, 71777214294589695) * 2**8, bitwise_and(value / 2**8, 71777214294589695))
+    # Swap adjacent 2-byte pairs (mask 0x0000ffff0000ffff)
+    y = bitwise_or(bitwise_and(y, 281470681808895) * 2**16, bitwise_and(y / 2**16, 281470681808895))
+    # Swap the two 4-byte halves
+    y = bitwise_or(bitwise_and(y, 4294967295) * 2**32, y / 2**32)
     return slice(convert(y, bytes32), start=24, len=8)
 
 
-@public
-@constant
-def get_deposit_root() -> bytes32:
-    zero_bytes32: bytes32 = 0x0000000000000000000000000000000000000000000000000000000000000000
-    node: bytes32 = zero_bytes32
-    size: uint256 = self.deposit_count
-    for height in range(DEPOSIT_CONTRACT_TREE_DEPTH):
-        if bitwise_and(size, 1) == 1:  # More gas efficient than `size % 2 == 1`
-            node = sha256(concat(self.branch[height], node))
-        else:
-            node = sha256(concat(node, self.zero_hashes[height]))
-        size /= 2
-    return sha256(concat(node, self.to_little_endian_64(self.deposit_count), slice(zero_bytes32, start=0, len=24)))
-
-
-@public
-@constant
-def get_deposit_count() -> bytes[8]:
-    return self.to_little_endian_64(self.deposit_count)
-
-
+# Note: `deposit` is declared first so the selector dispatcher checks it before any other function
 @payable
 @public
 def deposit(pubkey: bytes[PUBKEY_LENGTH],
             withdrawal_credentials: bytes[WITHDRAWAL_CREDENTIALS_LENGTH],
             signature: bytes[SIGNATURE_LENGTH],
             deposit_data_root: bytes32):
+    # Read the deposit count once; it is the index of this deposit
+    count: uint256 = self.deposit_count
+
     # Avoid overflowing the Merkle tree (and prevent edge case in computing `self.branch`)
-    assert self.deposit_count < MAX_DEPOSIT_COUNT
+    assert count < MAX_DEPOSIT_COUNT
 
     # Check deposit amount
     deposit_amount: uint256 = msg.value / as_wei_value(1, "gwei")
@@ -83,25 +67,26 @@ def deposit(pubkey: bytes[PUBKEY_LENGTH],
 
     # Emit `DepositEvent` log
     amount: bytes[8] = self.to_little_endian_64(deposit_amount)
-    log.DepositEvent(pubkey, withdrawal_credentials, amount, signature, self.to_little_endian_64(self.deposit_count))
+    log.DepositEvent(pubkey, withdrawal_credentials, amount, signature, self.to_little_endian_64(count))
 
     # Compute deposit data root (`DepositData` hash tree root)
+    # Note: zero padding is spelled out as bytes literals rather than sliced from `zero_bytes32` at runtime
     zero_bytes32: bytes32 = 0x0000000000000000000000000000000000000000000000000000000000000000
-    pubkey_root: bytes32 = sha256(concat(pubkey, slice(zero_bytes32, start=0, len=64 - PUBKEY_LENGTH)))
+    pubkey_root: bytes32 = sha256(concat(pubkey, b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"))
     signature_root: bytes32 = sha256(concat(
         sha256(slice(signature, start=0, len=64)),
-        sha256(concat(slice(signature, start=64, len=SIGNATURE_LENGTH - 64), zero_bytes32)),
+        sha256(concat(extract32(signature, 64, type=bytes32), zero_bytes32)),
     ))
     node: bytes32 = sha256(concat(
-        sha256(concat(pubkey_root, withdrawal_credentials)),
-        sha256(concat(amount, slice(zero_bytes32, start=0, len=32 - AMOUNT_LENGTH), signature_root)),
+        sha256(concat(pubkey_root, extract32(withdrawal_credentials, 0, type=bytes32))),
+        sha256(concat(amount, b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00", signature_root)),
     ))
     # Verify computed and expected deposit data roots match
     assert node == deposit_data_root
 
     # Add deposit data root to Merkle tree (update a single `branch` node)
-    self.deposit_count += 1
-    size: uint256 = self.deposit_count
+    size: uint256 = count + 1
+    self.deposit_count = size
     for height in range(DEPOSIT_CONTRACT_TREE_DEPTH):
         if bitwise_and(size, 1) == 1:  # More gas efficient than `size % 2 == 1`
             self.branch[height] = node
@@ -109,6 +94,29 @@ def deposit(pubkey: bytes[PUBKEY_LENGTH],
         node = sha256(concat(self.branch[height], node))
         size /= 2
 
+
+@public
+@constant
+def get_deposit_root() -> bytes32:
+    zero_bytes32: bytes32 = 0x0000000000000000000000000000000000000000000000000000000000000000
+    node: bytes32 = zero_bytes32
+    count: uint256 = self.deposit_count
+    size: uint256 = count
+    for height in range(DEPOSIT_CONTRACT_TREE_DEPTH):
+        if bitwise_and(size, 1) == 1:  # More gas efficient than `size % 2 == 1`
+            node = sha256(concat(self.branch[height], node))
+        else:
+            node = sha256(concat(node, self.zero_hashes[height]))
+        size /= 2
+    return sha256(concat(node, self.to_little_endian_64(count), b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"))
+
+
+@public
+@constant
+def get_deposit_count() -> bytes[8]:
+    return self.to_little_endian_64(self.deposit_count)
+
+
 # !!! DEBUG ONLY !!!
 # This method is NOT part of the final ETH2.0 deposit contract, but we use it
 # to recover test funds.
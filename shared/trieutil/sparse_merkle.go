@@ -55,13 +55,18 @@ func GenerateTrieFromItems(items [][]byte, depth uint64) (*SparseMerkleTrie, err
 		transformedLeaves[i] = arr[:]
 	}
 	layers[0] = transformedLeaves
+	// Hash each layer's 64-byte pairs with one hasher and a reused input buffer.
+	hasher := hashutil.CustomSHA256Hasher()
+	var pair [64]byte
 	for i := uint64(0); i < depth; i++ {
 		if len(layers[i])%2 == 1 {
 			layers[i] = append(layers[i], ZeroHashes[i][:])
 		}
-		updatedValues := make([][]byte, 0)
+		updatedValues := make([][]byte, 0, len(layers[i])/2)
 		for j := 0; j < len(layers[i]); j += 2 {
-			concat := hashutil.Hash(append(layers[i][j], layers[i][j+1]...))
+			copy(pair[:32], layers[i][j])
+			copy(pair[32:], layers[i][j+1])
+			concat := hasher(pair[:])
 			updatedValues = append(updatedValues, concat[:])
 		}
 		layers[i+1] = updatedValues
@@ -99,6 +104,8 @@ func (m *SparseMerkleTrie) Insert(item []byte, index int) {
 	}
 	currentIndex := index
 	root := bytesutil.ToBytes32(item)
+	hasher := hashutil.CustomSHA256Hasher()
+	var pair [64]byte
 	for i := 0; i < int(m.depth); i++ {
 		isLeft := currentIndex%2 == 0
 		neighborIdx := currentIndex ^ 1
@@ -109,12 +116,13 @@ func (m *SparseMerkleTrie) Insert(item []byte, index int) {
 			neighbor = m.branches[i][neighborIdx]
 		}
 		if isLeft {
-			parentHash := hashutil.Hash(append(root[:], neighbor...))
-			root = parentHash
+			copy(pair[:32], root[:])
+			copy(pair[32:], neighbor)
 		} else {
-			parentHash := hashutil.Hash(append(neighbor, root[:]...))
-			root = parentHash
+			copy(pair[:32], neighbor)
+			copy(pair[32:], root[:])
 		}
+		root = hasher(pair[:])
 		parentIdx := currentIndex / 2
 		if len(m.branches[i+1]) == 0 || parentIdx >= len(m.branches[i+1]) {
 			newItem := root
@@ -187,12 +195,20 @@ func VerifyMerkleBranch(root, item []byte, merkleIndex int, proof [][]byte, dept
 		return false
 	}
 	node := bytesutil.ToBytes32(item)
+	hasher := hashutil.CustomSHA256Hasher()
+	var pair [64]byte
 	for i := 0; i <= int(depth); i++ {
+		if len(proof[i]) != 32 {
+			return false
+		}
 		if (uint64(merkleIndex) / mathutil.PowerOf2(uint64(i)) % 2) != 0 {
-			node = hashutil.Hash(append(proof[i], node[:]...))
+			copy(pair[:32], proof[i])
+			copy(pair[32:], node[:])
 		} else {
-			node = hashutil.Hash(append(node[:], proof[i]...))
+			copy(pair[:32], node[:])
+			copy(pair[32:], proof[i])
 		}
+		node = hasher(pair[:])
 	}
 
 	return bytes.Equal(root, node[:])
@@ -111,6 +111,25 @@ func TestMerkleTrie_VerifyMerkleProof(t *testing.T) {
 	require.Equal(t, false, VerifyMerkleBranch(root[:], []byte("buzz"), 3, proof, params.BeaconConfig().DepositContractTreeDepth))
 }
 
+func TestMerkleTrie_VerifyMerkleProof_InvalidProofItemLength(t *testing.T) {
+	items := [][]byte{
+		[]byte("A"),
+		[]byte("B"),
+		[]byte("C"),
+		[]byte("D"),
+	}
+	m, err := GenerateTrieFromItems(items, params.BeaconConfig().DepositContractTreeDepth)
+	require.NoError(t, err)
+	proof, err := m.MerkleProof(1)
+	require.NoError(t, err)
+	root := m.Root()
+	require.Equal(t, true, VerifyMerkleBranch(root[:], items[1], 1, proof, params.BeaconConfig().DepositContractTreeDepth))
+
+	// A proof item carrying a trailing byte must not verify.
+	proof[0] = append(bytesutil.SafeCopyBytes(proof[0]), 0)
+	require.Equal(t, false, VerifyMerkleBranch(root[:], items[1], 1, proof, params.BeaconConfig().DepositContractTreeDepth))
+}
+
 func TestMerkleTrie_VerifyMerkleProof_TrieUpdated(t *testing.T) {
 	items := [][]byte{
 		{1},